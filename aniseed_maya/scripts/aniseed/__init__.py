@@ -15,17 +15,43 @@ of interaction is minimal.
 """
 from .rig import Rig
 from .rig import get_rig
+from .rig import RigHandle
+from .rig import clear_rig_cache
 from .host import EmbeddedHost
 from .component import RigComponent
 from .config import RigConfiguration
-from .app import AppConfig
-from .app import AppWidget
-from .app import AppWindow
 
-from . import app
-from . import widgets
 from . import constants
 from . import resources
 from . import environment
 
+# -- The ui modules and the toolkit are only imported when they are first
+# -- accessed. This means headless sessions (such as farm builds) never pay
+# -- the cost of importing Qt and the ui machinery they do not use
+_LAZY_ATTRIBUTES = dict(
+    app=(".app", None),
+    widgets=(".widgets", None),
+    AppConfig=(".app", "AppConfig"),
+    AppWidget=(".app", "AppWidget"),
+    AppWindow=(".app", "AppWindow"),
+    aniseed_toolkit=("aniseed_toolkit", None),
+)
+
+
+# --------------------------------------------------------------------------------------
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name, __name__)
+
+    value = getattr(module, attribute_name) if attribute_name else module
+    globals()[name] = value
+
+    return value
+
+
 __version__ = "3.0.1"
@@ -117,19 +117,15 @@ class AppWidget(xstack.app.AppWidget):
         )
         rigs_menu.addSeparator()
 
-        # -- Cycle all the rigs in the scene and add them into the menu too
-        rigs = crosswalk.items.all_items_with_attribute(
-            attribute_name="aniseed_rig",
-        )
-
-        for rig_host in rigs or list():
-            switch_rig_action = rigs_menu.addAction(
-                crosswalk.items.get_name(rig_host)
-            )
+        # -- Cycle all the rigs in the scene and add them into the menu too. We
+        # -- only read the handles here, the rig is constructed when switched to
+        for handle in self.app_config.stack_class.list_hosts():
+            switch_rig_action = rigs_menu.addAction(handle.name)
+            switch_rig_action.setToolTip(f"{handle.component_count} components")
             switch_rig_action.triggered.connect(
                 functools.partial(
                     self.switch_rig,
-                    rig_host,
+                    handle.host,
                 )
             )
         rigs_menu.addSeparator()
@@ -0,0 +1,330 @@
+"""
+This module allows for many rig recipes to be built headlessly in parallel. Each
+recipe is built in its own worker interpreter, meaning a crash or hang in one build
+cannot affect any other. Each worker also starts its build from a new scene.
+
+A build is considered to have failed if any of the components in its recipe
+could not be loaded, as building the remainder would only give a partial rig.
+
+It can be run from the command line:
+
+```
+    python -m aniseed.batch BipedTemplate.json GiraffeTemplate.json --workers 4
+```
+
+When running within Maya you should point the interpreter at mayapy, in which
+case each worker will initialise Maya standalone before building:
+
+```
+    mayapy -m aniseed.batch *.json --interpreter mayapy --report nightly.json
+```
+
+When no application is available the builds will run against the crosswalk
+standalone backend, which makes this suitable for CI.
+
+Alternatively you can call it directly from python:
+
+```
+    import aniseed.batch
+
+    results = aniseed.batch.run(
+        ["BipedTemplate.json", "GiraffeTemplate.json"],
+        workers=2,
+        timeout=600,
+        retries=1,
+    )
+```
+"""
+import os
+import sys
+import json
+import time
+import typing
+import argparse
+import tempfile
+import collections
+import subprocess
+import concurrent.futures
+
+
+# --------------------------------------------------------------------------------------
+class JobStatus:
+    """
+    This is considered an enum class for storing the state of a batch job
+    """
+    Success = "success"
+    Failed = "failed"
+    Timeout = "timeout"
+    Crashed = "crashed"
+
+
+# -- These are the modules whose locations must be visible to the
+# -- worker interpreters
+_REQUIRED_MODULES = [
+    "aniseed",
+    "xstack",
+    "crosswalk",
+    "factories",
+    "signalling",
+]
+
+
+# --------------------------------------------------------------------------------------
+def build_recipe(recipe_path: str) -> typing.Dict:
+    """
+    This builds the given recipe within the current interpreter and returns the
+    serialised build report. This is what is run by each worker.
+
+    Args:
+        recipe_path: Absolute path to the recipe to build
+
+    Returns:
+        The serialised xstack.report.BuildReport of the build
+    """
+    from . import environment
+
+    environment.initialise_headless()
+
+    import xstack
+    import crosswalk
+
+    from . import rig
+
+    # -- Every build starts from an empty scene, regardless of how the
+    # -- interpreter was started
+    crosswalk.scene.new(force=True)
+
+    data = xstack.compat.load(recipe_path)
+
+    rig_instance = rig.Rig(
+        label=os.path.splitext(os.path.basename(recipe_path))[0],
+    )
+    rig_instance.deserialize(data)
+
+    # -- Components which are not recognised, or which fail to initialise, are
+    # -- dropped when the recipe is loaded. Building the remainder would give a
+    # -- partial rig, so we consider the build to have failed
+    missing = _missing_component_types(data, rig_instance)
+
+    if missing:
+        build_report = xstack.report.BuildReport(label=rig_instance.label)
+        build_report.error = f"Components could not be loaded : {', '.join(missing)}"
+        build_report.finalise(rig_instance)
+
+        report = build_report.serialise()
+        report["missing_components"] = missing
+
+        return report
+
+    return rig_instance.build_with_report(count_nodes=True).serialise()
+
+
+# --------------------------------------------------------------------------------------
+def _missing_component_types(data: typing.Dict, rig_instance) -> typing.List[str]:
+    """
+    Returns the types of the components in the recipe data which are not
+    present in the rig, with one entry for every missing component
+    """
+    expected = collections.Counter()
+    blocks = list(data.get("tree", list()))
+
+    while blocks:
+        block = blocks.pop()
+        expected[block["component_type"]] += 1
+        blocks.extend(block.get("children", list()))
+
+    loaded = collections.Counter(
+        component.identifier
+        for component in rig_instance.components()
+    )
+
+    return sorted((expected - loaded).elements())
+
+
+# --------------------------------------------------------------------------------------
+def run(
+    recipes: typing.List[str],
+    workers: int or None = None,
+    timeout: float or None = None,
+    retries: int = 0,
+    interpreter: str or None = None,
+) -> typing.Dict:
+    """
+    This will build all the given recipes, each in its own worker interpreter.
+
+    Args:
+        recipes: List of absolute paths to recipe files
+        workers: The number of builds to run in parallel. Defaults to the
+            number of cpus
+        timeout: The number of seconds a single build is allowed to take before
+            the worker is terminated
+        retries: How many times a build should be re-attempted if its worker
+            crashes or times out. Builds which fail are not retried as their
+            failure is considered to be deterministic
+        interpreter: The python interpreter to run each worker with. Defaults
+            to the current interpreter
+
+    Returns:
+        An aggregated report of all the builds
+    """
+    start_time = time.time()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        jobs = list(
+            pool.map(
+                lambda recipe: _run_job(
+                    recipe,
+                    timeout=timeout,
+                    retries=retries,
+                    interpreter=interpreter or sys.executable,
+                ),
+                recipes,
+            )
+        )
+
+    return dict(
+        success=all(job["status"] == JobStatus.Success for job in jobs),
+        duration=time.time() - start_time,
+        jobs=jobs,
+    )
+
+
+# --------------------------------------------------------------------------------------
+def _run_job(recipe: str, timeout: float or None, retries: int, interpreter: str) -> typing.Dict:
+    """
+    Runs the build of a single recipe in a worker interpreter, retrying when the
+    worker crashes or times out.
+    """
+    recipe = os.path.abspath(recipe)
+    job = dict(
+        recipe=recipe,
+        status=JobStatus.Crashed,
+        attempts=0,
+        duration=0.0,
+        error="",
+        report=None,
+    )
+
+    while job["attempts"] <= retries:
+        job["attempts"] += 1
+        start_time = time.time()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.json")
+
+            try:
+                process = subprocess.run(
+                    [
+                        interpreter,
+                        "-m", "aniseed.batch",
+                        "--worker", recipe,
+                        "--report", report_path,
+                    ],
+                    env=_worker_environment(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    timeout=timeout,
+                )
+
+            except subprocess.TimeoutExpired:
+                job["status"] = JobStatus.Timeout
+                job["error"] = f"Build exceeded the timeout of {timeout} seconds"
+                job["duration"] = time.time() - start_time
+                continue
+
+            job["duration"] = time.time() - start_time
+
+            if process.returncode != 0 or not os.path.exists(report_path):
+                job["status"] = JobStatus.Crashed
+                job["error"] = process.stdout.decode(errors="replace")
+                continue
+
+            with open(report_path, "r") as f:
+                job["report"] = json.load(f)
+
+        job["error"] = job["report"].get("error") or ""
+        job["status"] = JobStatus.Success if job["report"]["success"] else JobStatus.Failed
+        break
+
+    return job
+
+
+# --------------------------------------------------------------------------------------
+def _worker_environment() -> typing.Dict:
+    """
+    Returns the environment the worker interpreters should run with. This ensures
+    aniseed and its dependencies are importable from the worker regardless of
+    which interpreter is being used.
+    """
+    paths = list()
+
+    for module_name in _REQUIRED_MODULES:
+        module = sys.modules.get(module_name)
+
+        if not module or not getattr(module, "__file__", None):
+            continue
+
+        path = os.path.dirname(os.path.dirname(module.__file__))
+
+        if path not in paths:
+            paths.append(path)
+
+    environment = os.environ.copy()
+    environment["PYTHONPATH"] = os.pathsep.join(
+        paths + [p for p in environment.get("PYTHONPATH", "").split(os.pathsep) if p]
+    )
+
+    return environment
+
+
+# --------------------------------------------------------------------------------------
+def main(argv: typing.List[str] or None = None) -> int:
+    """
+    Command line entry point. Returns zero if every build succeeded.
+    """
+    parser = argparse.ArgumentParser(
+        prog="aniseed.batch",
+        description="Builds aniseed rig recipes in parallel worker processes",
+    )
+    parser.add_argument("recipes", nargs="*", help="Recipe files to build")
+    parser.add_argument("--workers", type=int, default=None, help="Number of parallel builds")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds allowed per build")
+    parser.add_argument("--retries", type=int, default=0, help="Retries for crashed builds")
+    parser.add_argument("--interpreter", default=None, help="Interpreter to run workers with")
+    parser.add_argument("--report", default=None, help="Filepath to write the json report to")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+
+    # -- If we're a worker, we build the single recipe and write its report
+    if args.worker:
+        report = build_recipe(args.worker)
+
+        with open(args.report, "w") as f:
+            json.dump(report, f)
+
+        return 0
+
+    results = run(
+        args.recipes,
+        workers=args.workers,
+        timeout=args.timeout,
+        retries=args.retries,
+        interpreter=args.interpreter,
+    )
+
+    for job in results["jobs"]:
+        print(f"{job['status'].upper().ljust(8)} : {job['recipe']} ({job['attempts']} attempts, {round(job['duration'], 2)}s)")
+
+        if job["status"] == JobStatus.Failed and job["error"]:
+            print(f"         : {job['error']}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=4)
+
+    return 0 if results["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
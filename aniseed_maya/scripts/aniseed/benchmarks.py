@@ -0,0 +1,331 @@
+"""
+This module benchmarks the parts of aniseed which are called at rig scale. The
+results are written as json, so they can be stored and compared across releases.
+
+```
+    python -m aniseed.benchmarks --count 50000 --output results.json
+```
+
+The naming benchmarks generate names through the rig configuration. The
+"uncompiled" benchmark compiles the naming options for every name, which is
+representative of reading the options and applying the styles per name, and
+acts as the baseline for the others.
+
+The import time of aniseed can also be measured. This imports aniseed in a fresh,
+non-gui interpreter using `python -X importtime` and compares the result against
+a budget. The exit code is non-zero if the budget is exceeded, or if any of the
+ui modules were imported.
+
+```
+    python -m aniseed.benchmarks --import-time --budget 0.25
+```
+"""
+import os
+import sys
+import json
+import time
+import typing
+import argparse
+import platform
+import subprocess
+
+from . import naming
+
+# -- The default number of names to generate
+DEFAULT_COUNT = 50000
+
+# -- The default number of seconds `import aniseed` may take in a non-gui
+# -- interpreter
+DEFAULT_IMPORT_BUDGET = 0.25
+
+# -- These modules are only needed by the ui, so should never be imported
+# -- when aniseed is imported headless
+UI_MODULES = [
+    "Qt",
+    "PySide2",
+    "PySide6",
+    "qtility",
+    "xstack.app",
+    "aniseed.app",
+    "aniseed.widgets",
+    "aniseed_toolkit",
+]
+
+# -- The parts the names are generated from. These are cycled through so that
+# -- the style memoisation sees a realistic spread of values
+_CLASSIFICATIONS = ["ctl", "jnt", "zro", "off", "mech", "org"]
+_LOCATIONS = ["lf", "rt", "md", "fr", "bk"]
+_DESCRIPTION_COUNT = 250
+
+
+# --------------------------------------------------------------------------------------
+def generate_specs(count: int) -> typing.List[typing.Dict]:
+    """
+    Returns a list of name specs, as taken by RigConfiguration.generate_names
+    """
+    return [
+        dict(
+            classification=_CLASSIFICATIONS[index % len(_CLASSIFICATIONS)],
+            description=f"limb_part_{index % _DESCRIPTION_COUNT}",
+            location=_LOCATIONS[index % len(_LOCATIONS)],
+            counter=index % 20,
+            unique=False,
+        )
+        for index in range(count)
+    ]
+
+
+# --------------------------------------------------------------------------------------
+def create_config():
+    """
+    Returns a rig configuration which is part of a rig
+    """
+    from . import rig
+    from . import config
+
+    rig_instance = rig.Rig(label="benchmark")
+
+    return rig_instance.add_component(
+        component_type=config.RigConfiguration.identifier,
+        label="Rig Configuration",
+        supress_events=True,
+    )
+
+
+# --------------------------------------------------------------------------------------
+def bench_uncompiled(config, specs: typing.List[typing.Dict]) -> float:
+    start_time = time.perf_counter()
+
+    for spec in specs:
+        naming.NameFormatter.from_config(config).format(
+            spec["classification"],
+            spec["description"],
+            spec["location"],
+            spec["counter"],
+        )
+
+    return time.perf_counter() - start_time
+
+
+# --------------------------------------------------------------------------------------
+def bench_generate_name(config, specs: typing.List[typing.Dict]) -> float:
+    start_time = time.perf_counter()
+
+    for spec in specs:
+        config.generate_name(**spec)
+
+    return time.perf_counter() - start_time
+
+
+# --------------------------------------------------------------------------------------
+def bench_generate_names(config, specs: typing.List[typing.Dict]) -> float:
+    start_time = time.perf_counter()
+    config.generate_names(specs)
+
+    return time.perf_counter() - start_time
+
+
+# -- These are all the operations which are benchmarked, in the order
+# -- they are run
+OPERATIONS = dict(
+    uncompiled=bench_uncompiled,
+    generate_name=bench_generate_name,
+    generate_names=bench_generate_names,
+)
+
+
+# --------------------------------------------------------------------------------------
+def run(
+    count: int = DEFAULT_COUNT,
+    operations: typing.List[str] or None = None,
+    repeat: int = 3,
+) -> typing.Dict:
+    """
+    Runs the benchmarks and returns the results.
+
+    Args:
+        count: The number of names to generate in each benchmark
+        operations: The names of the operations to benchmark. Defaults to all
+        repeat: The number of times to run each operation. The fastest is reported
+
+    Returns:
+        Json serialisable dictionary of results
+    """
+    config = create_config()
+    specs = generate_specs(count)
+    results = list()
+
+    for operation_name in operations or OPERATIONS:
+        timings = list()
+
+        for _ in range(max(repeat, 1)):
+            # -- The decomposition map grows with every name, so we reset it
+            # -- to keep each repeat comparable
+            config.on_build_started()
+            timings.append(OPERATIONS[operation_name](config, specs))
+
+        results.append(
+            dict(
+                operation=operation_name,
+                count=count,
+                seconds=min(timings),
+                names_per_second=count / min(timings) if min(timings) else None,
+            )
+        )
+
+    return dict(
+        benchmark="naming",
+        timestamp=time.time(),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        repeat=repeat,
+        results=results,
+    )
+
+
+# --------------------------------------------------------------------------------------
+def measure_import_time(module: str = "aniseed") -> typing.Dict[str, int]:
+    """
+    Imports the given module in a fresh interpreter and returns the cumulative
+    import time, in microseconds, of every module which was imported as a result.
+    """
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+    if process.returncode:
+        raise RuntimeError(f"Failed to import {module}:\n{process.stderr}")
+
+    timings = dict()
+
+    # -- Each line takes the form "import time: self | cumulative | name"
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        try:
+            timings[name.strip()] = int(cumulative)
+
+        # -- This is the header line
+        except ValueError:
+            continue
+
+    return timings
+
+
+# --------------------------------------------------------------------------------------
+def run_import_time(
+    module: str = "aniseed",
+    budget: float = DEFAULT_IMPORT_BUDGET,
+    repeat: int = 3,
+) -> typing.Dict:
+    """
+    Measures the import time of the given module against the budget.
+
+    Args:
+        module: The module to import
+        budget: The number of seconds the import may take
+        repeat: The number of times to import the module. The fastest is reported
+
+    Returns:
+        Json serialisable dictionary of results
+    """
+    runs = [
+        measure_import_time(module)
+        for _ in range(max(repeat, 1))
+    ]
+
+    fastest = min(runs, key=lambda timings: timings.get(module, 0))
+    seconds = fastest.get(module, 0) / 1000000
+
+    ui_modules = [
+        name
+        for name in fastest
+        if any(name == ui_module or name.startswith(ui_module + ".") for ui_module in UI_MODULES)
+    ]
+
+    slowest = sorted(
+        (
+            (name, timing)
+            for name, timing in fastest.items()
+            if name != module
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:10]
+
+    return dict(
+        benchmark="import_time",
+        timestamp=time.time(),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        repeat=repeat,
+        module=module,
+        seconds=seconds,
+        budget=budget,
+        within_budget=seconds <= budget and not ui_modules,
+        ui_modules=ui_modules,
+        slowest=[
+            dict(module=name, seconds=timing / 1000000)
+            for name, timing in slowest
+        ],
+    )
+
+
+# --------------------------------------------------------------------------------------
+def main(argv: typing.List[str] or None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aniseed.benchmarks",
+        description="Benchmarks the rig scale operations of aniseed",
+    )
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS), default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="Filepath to write the json results to")
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="Measure the import time of aniseed rather than the naming operations",
+    )
+    parser.add_argument("--budget", type=float, default=DEFAULT_IMPORT_BUDGET)
+
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        results = run_import_time(
+            budget=args.budget,
+            repeat=args.repeat,
+        )
+
+    else:
+        results = run(
+            count=args.count,
+            operations=args.operations,
+            repeat=args.repeat,
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+    else:
+        json.dump(results, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+
+    if not results.get("within_budget", True):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,33 +2,13 @@ import re
 import typing
 import crosswalk
 
+from . import naming
 from . import component
-from . import widgets
 
-
-def ignore(name: typing.Any) -> str:
-    """
-    callable that does nothing
-    """
-    return name
-
-
-def camel_to_snake(name: str) -> str:
-    """
-    Will convert a camel case string to a snake case string
-    """
-    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
-
-
-def title(name: str) -> str:
-    """
-    Will convert a snake case string to a camel case string
-    """
-    if name[0].isupper() and "_" not in name:
-        return name
-
-    return name.title()
+# -- These are exposed here for backward compatibility
+from .naming import ignore
+from .naming import camel_to_snake
+from .naming import title
 
 
 class RigConfiguration(component.RigComponent):
@@ -105,6 +85,15 @@ class RigConfiguration(component.RigComponent):
             group="Naming Format"
         )
 
+        # -- Names are decomposed by parsing them against the rule, so storing
+        # -- the parts of every generated name is only needed for rules which
+        # -- cannot be parsed unambiguously
+        self.declare_option(
+            name="store_decomposition_map",
+            value=False,
+            group="Naming Format"
+        )
+
         self.declare_option(
             name="decomposition_map",
             value=dict(),
@@ -112,6 +101,18 @@ class RigConfiguration(component.RigComponent):
         )
         self._decomposition_map = dict()
 
+        # -- The naming options are compiled into a formatter, which is only
+        # -- re-compiled when the revision of any naming option changes
+        self._name_formatter: naming.NameFormatter or None = None
+        self._name_formatter_key: typing.Tuple or None = None
+
+        self._name_parser: naming.NameParser or None = None
+        self._name_parser_key: typing.Tuple or None = None
+
+        # -- During a build, unique names are allocated through a registry
+        # -- of the names which are taken
+        self._name_registry: naming.NameRegistry or None = None
+
     # ----------------------------------------------------------------------------------
     # This MUST be re-implemented
     def run(self) -> bool:
@@ -141,6 +142,10 @@ class RigConfiguration(component.RigComponent):
     def option_widget(self, option_name: str):
 
         if option_name in self.styling:
+            # -- The widgets are only imported when a ui asks for them, so that
+            # -- headless sessions never import Qt
+            from . import widgets
+
             return widgets.ItemSelector(
                 [
                     "lower",
@@ -268,30 +273,46 @@ class RigConfiguration(component.RigComponent):
         }
 
     def apply_style(self, str_value, format_type):
+        return naming.apply_style(str_value, format_type)
 
-        if format_type == "ignore":
-            return str_value
+    def name_formatter(self) -> naming.NameFormatter:
+        """
+        Returns the compiled form of the naming options. This is cached, and is
+        only compiled again when one of the naming options changes.
+        """
+        key = tuple(
+            self.option(option_name).revision()
+            for option_name in naming.NAMING_OPTIONS
+        )
 
-        if format_type == "lower":
-            return str_value.lower()
+        if self._name_formatter is None or key != self._name_formatter_key:
+            self._name_formatter = naming.NameFormatter.from_config(self)
+            self._name_formatter_key = key
 
-        if format_type == "upper":
-            return str_value.upper()
+        return self._name_formatter
 
-        if format_type == "titled":
-            return "".join(
-                [
-                    title(part)
-                    for part in str_value.split("_")
-                    if part
-                ]
-            )
-            return title(str_value)
+    def name_parser(self) -> naming.NameParser:
+        """
+        Returns the parser which decomposes names formed by this config. This is
+        cached, and is only compiled again when the naming options or any of the
+        classification or location labels change.
+        """
+        label_options = list(self.naming_items) + list(self.location_items)
+
+        key = tuple(
+            self.option(option_name).revision()
+            for option_name in naming.NAMING_OPTIONS + label_options
+        )
 
-        if format_type == "snake":
-            return camel_to_snake(str_value)
+        if self._name_parser is None or key != self._name_parser_key:
+            self._name_parser = naming.NameParser(
+                self.name_formatter(),
+                classifications=[self.option(label).get() for label in self.naming_items],
+                locations=[self.option(label).get() for label in self.location_items],
+            )
+            self._name_parser_key = key
 
-        return str_value
+        return self._name_parser
 
     def generate_name(
             self,
@@ -307,35 +328,89 @@ class RigConfiguration(component.RigComponent):
         If unique is True then the counter will be incremented until a name is found
         that is unique to the scene.
         """
-        while True:
-
-            name = self.rule[:].format(
-                classification=self.apply_style(classification, self.option("classification_style").get()),
-                description=self.apply_style(description, self.option("description_style").get()),
-                location=self.apply_style(location, self.option("location_style").get()),
-                counter=str(counter).rjust(self.option("counter_padding").get(), "0"))
-
-            if not unique:
-                self.store_name_decomposition(
-                    name,
-                    classification,
-                    description,
-                    location,
-                    counter,
-                )
-                return name
-
-            if not crosswalk.items.exists(name):
-                self.store_name_decomposition(
-                    name,
-                    classification,
-                    description,
-                    location,
-                    counter,
-                )
-                return name
+        return self._generate_name(
+            self.name_formatter(),
+            classification,
+            description,
+            location,
+            counter=counter,
+            unique=unique,
+            registry=self._name_registry,
+        )
+
+    def generate_names(self, specs: typing.List[typing.Dict]) -> typing.List[str]:
+        """
+        This will generate a name for each of the given specs, where each spec
+        is a dictionary of the arguments taken by generate_name:
+
+        ```
+            names = config.generate_names(
+                [
+                    dict(classification="ctl", description="Finger", location="lf"),
+                    dict(classification="ctl", description="Finger", location="rt"),
+                ]
+            )
+        ```
+
+        This is faster than calling generate_name for each name as the naming
+        options are only read once. Names which are required to be unique are
+        also unique amongst each other, even though none of them exist in the
+        scene yet.
+        """
+        formatter = self.name_formatter()
+
+        # -- Outside of a build we use a registry for just this batch
+        registry = self._name_registry or naming.NameRegistry(formatter.pattern)
+
+        return [
+            self._generate_name(
+                formatter,
+                spec["classification"],
+                spec["description"],
+                spec["location"],
+                counter=spec.get("counter", 1),
+                unique=spec.get("unique", True),
+                registry=registry,
+            )
+            for spec in specs
+        ]
+
+    def _generate_name(
+            self,
+            formatter: naming.NameFormatter,
+            classification: str,
+            description: str,
+            location: str,
+            counter: int = 1,
+            unique: bool = True,
+            registry: naming.NameRegistry or None = None,
+    ) -> str:
+        if unique and registry:
+            name, counter = registry.allocate(
+                formatter,
+                classification,
+                description,
+                location,
+                counter=counter,
+            )
+
+        else:
+            while True:
+                name = formatter.format(classification, description, location, counter)
+
+                if not unique or not crosswalk.items.exists(name):
+                    break
 
-            counter += 1
+                counter += 1
+
+        self.store_name_decomposition(
+            name,
+            classification,
+            description,
+            location,
+            counter,
+        )
+        return name
 
     def on_build_started(self):
         """
@@ -347,15 +422,25 @@ class RigConfiguration(component.RigComponent):
         # -- any name generated through this config.
         self._decomposition_map = dict()
 
+        # -- Names generated during the build are allocated through a registry
+        # -- which is seeded from the scene on first use
+        self._name_registry = naming.NameRegistry(self.name_formatter().pattern)
+
     def on_build_finished(self, successful: bool):
         """
         These functions are specific to the rig configuration and allow the
         config node to operate before and after the build.
         """
-        # -- At the end of the build we store the decomposition map into a
-        # -- hidden option. This allows any tools which later interact
-        # -- with the rig to decompose the name
-        self.option("decomposition_map").set(self._decomposition_map)
+        # -- If requested, at the end of the build we store the decomposition
+        # -- map into a hidden option. This allows tools to decompose names
+        # -- which cannot be parsed against the rule
+        if self.option("store_decomposition_map").get():
+            self.option("decomposition_map").set(self._decomposition_map)
+
+        else:
+            self.option("decomposition_map").set(dict())
+
+        self._name_registry = None
 
     def store_name_decomposition(
         self,
@@ -377,19 +462,38 @@ class RigConfiguration(component.RigComponent):
         )
 
     def decompose_name(self, name):
-        decomposition_map = self.option("decomposition_map").get()
+        """
+        Returns the classification, description, location and counter the
+        given name was generated from, or None if it cannot be decomposed.
+        The parts are unstyled, so they can be passed back to generate_name
+        to form the same name (or, with a different location, its opposite).
+        """
+        # -- Names generated in this session are held in memory
+        if name in self._decomposition_map:
+            return dict(self._decomposition_map[name])
 
-        if name not in decomposition_map:
-            print(decomposition_map)
-            return None
+        decomposition = self.name_parser().parse(name)
 
-        return decomposition_map[name]
+        if decomposition:
+            return decomposition
+
+        # -- Fall back to any map stored during a previous build
+        decomposition = self.option("decomposition_map").get().get(name)
+
+        return dict(decomposition) if decomposition else None
 
     def extract_description(self, name: str) -> str:
         """
         This function should always be able to return the descriptive component
         of a name
         """
+        decomposition = self.name_parser().parse(name)
+
+        if decomposition and "description" in decomposition:
+            return decomposition["description"]
+
+        # -- If the name does not follow the rule we assume it is formed
+        # -- of four underscore separated parts
         parts = [
             p
             for p in re.split(r"\{|\}", self.rule)
@@ -4,4 +4,16 @@
 # -- always look at for paths to find components within.
 RIG_COMPONENTS_PATHS_ENVVAR = "ANISEED_RIG_COMPONENT_PATHS"
 
+# -- Alongside the recipe, the host of each rig stores a small header describing
+# -- the recipe. This allows the rigs in a scene to be listed without having
+# -- to read and deserialise each recipe.
+RECIPE_HEADER_ATTRIBUTE = "recipe_header"
+
+# -- The embedded host is normally discovered by scanning the hosts folder. This
+# -- environment variable allows the host to be pinned instead, which means
+# -- headless sessions never import the hosts of other applications. It may
+# -- be the name of a module within the hosts folder (such as "standalone") or
+# -- an importable class path (such as "my_package.hosts:MyHost").
+HOST_ENVVAR = "ANISEED_HOST"
+
 website = "https://github.com/mikemalinowski/aniseed"
\ No newline at end of file
@@ -8,3 +8,17 @@ def initialize():
     """
     host_app = host.get()
     host_app.environment_initialization()
+
+
+def initialise_headless():
+    """
+    This should be called before using aniseed from a headless interpreter. If
+    we are running within an application which needs initialising for headless
+    use, such as mayapy, then it is initialised here.
+    """
+    try:
+        import maya.standalone
+        maya.standalone.initialize(name="python")
+
+    except ImportError:
+        pass
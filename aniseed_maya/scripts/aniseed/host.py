@@ -1,6 +1,10 @@
 import os
+import inspect
+import importlib
 import factories
 
+from . import constants
+
 
 class EmbeddedHost:
     """
@@ -65,12 +69,57 @@ class EmbeddedHosts(factories.Factory):
 
     @classmethod
     def get_host(cls):
+        """
+        Returns the host for this session. This is resolved once, either from
+        the host pinned through the ANISEED_HOST environment variable or by
+        scanning the hosts folder, and is then cached.
+        """
         if cls._HOST is None:
-            for plugin in sorted(cls.as_singleton().plugins(), key=lambda p: p.priority):
-                cls._HOST = plugin()
-                break
+            pinned = os.environ.get(constants.HOST_ENVVAR)
+
+            if pinned:
+                cls._HOST = _pinned_host(pinned)()
+
+            else:
+                for plugin in sorted(cls.as_singleton().plugins(), key=lambda p: p.priority):
+                    cls._HOST = plugin()
+                    break
+
+            # -- If no host is available we fall back to the default behaviour
+            if cls._HOST is None:
+                cls._HOST = EmbeddedHost()
+
         return cls._HOST
 
+    @classmethod
+    def reset(cls):
+        """
+        Clears the cached registry and host, causing them to be resolved
+        again the next time they are requested
+        """
+        cls._INSTANCE = None
+        cls._HOST = None
+
 
 def get() -> EmbeddedHost:
-    return EmbeddedHosts().as_singleton().get_host()
+    return EmbeddedHosts.get_host()
+
+
+def _pinned_host(pinned: str) -> type:
+    """
+    Returns the host class described by the value of the ANISEED_HOST
+    environment variable
+    """
+    # -- A full class path was given
+    if ":" in pinned:
+        module_name, class_name = pinned.split(":", 1)
+        return getattr(importlib.import_module(module_name), class_name)
+
+    # -- Otherwise we only import the requested module from the hosts folder
+    module = importlib.import_module(f"{__package__}.hosts.{pinned}")
+
+    for _, item in inspect.getmembers(module, inspect.isclass):
+        if issubclass(item, EmbeddedHost) and item.__module__ == module.__name__:
+            return item
+
+    raise ValueError(f"{pinned} does not define an embedded host")
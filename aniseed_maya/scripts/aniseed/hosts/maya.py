@@ -8,6 +8,7 @@ from Qt import QtCore, QtWidgets, QtGui
 
 import maya
 from maya import cmds
+import maya.api.OpenMaya as om
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 
 
@@ -58,6 +59,14 @@ class StandaloneHost(aniseed.EmbeddedHost):
         """
         MenuBuilder.build()
 
+        # -- Cached rigs belong to the scene they were read from, so the
+        # -- cache is cleared whenever the scene is replaced
+        for message in (om.MSceneMessage.kBeforeNew, om.MSceneMessage.kBeforeOpen):
+            om.MSceneMessage.addCallback(
+                message,
+                lambda *args: aniseed.clear_rig_cache(),
+            )
+
     def on_rig_save(self, rig) -> dict:
         """
         This is called when a rig is being saved
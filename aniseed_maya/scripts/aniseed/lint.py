@@ -0,0 +1,181 @@
+"""
+This module allows rig recipes to be checked for problems without Maya and
+without building them. On top of the checks carried out by xstack.lint, the rig
+linter flags recipes which contain more than one Rig Configuration component.
+
+Recipes are checked against the schemas of the aniseed components. Many of the
+components can only be imported within Maya, so the typical workflow is to write
+a manifest of the component schemas from within mayapy whenever the components
+change:
+
+```
+    mayapy -m aniseed.lint --write-manifest aniseed_components.json
+```
+
+That manifest can then be used to lint recipes anywhere, such as in CI, using
+the crosswalk standalone backend:
+
+```
+    python -m aniseed.lint recipes/*.json --manifest aniseed_components.json
+```
+"""
+import sys
+import json
+import typing
+import argparse
+import contextlib
+import xstack
+import crosswalk
+
+from . import config
+
+
+# --------------------------------------------------------------------------------------
+class RigIssueCode(xstack.lint.IssueCode):
+    """
+    This is considered an enum class for storing the types of issue which
+    can be found within rig recipes
+    """
+    MultipleRigConfigurations = "multiple-rig-configurations"
+
+
+# --------------------------------------------------------------------------------------
+class RigLinter(xstack.lint.Linter):
+    """
+    Checks rig recipes against the schemas of the aniseed components
+    """
+
+    # ----------------------------------------------------------------------------------
+    def checks(self) -> typing.List[callable]:
+        return super(RigLinter, self).checks() + [
+            self.check_rig_configurations,
+        ]
+
+    # ----------------------------------------------------------------------------------
+    def check_rig_configurations(self, blocks: typing.List[typing.Dict]) -> typing.List[typing.Dict]:
+        """
+        A rig must only ever have a single configuration component, as the rig
+        will only ever use the first one it finds.
+        """
+        configurations = [
+            block
+            for block in blocks
+            if block["component_type"].startswith("Rig Configuration :")
+        ]
+
+        return [
+            xstack.lint.issue(
+                RigIssueCode.MultipleRigConfigurations,
+                f"{len(configurations)} rig configuration components were found, "
+                f"only one is permitted",
+                block,
+            )
+            for block in configurations[1:]
+        ]
+
+
+# --------------------------------------------------------------------------------------
+@contextlib.contextmanager
+def component_library() -> typing.Iterator["xstack.library.ComponentLibrary"]:
+    """
+    Gives the component library of a temporary rig which holds a rig
+    configuration. The schemas are extracted against this rig, as many
+    components read the configuration during their initialisation. The host of
+    the rig is removed from the scene on exit.
+    """
+    from . import rig
+
+    rig_instance = rig.Rig(label="lint")
+    rig_instance.add_component(
+        component_type=config.RigConfiguration.identifier,
+        label="Rig Configuration",
+    )
+
+    library = rig_instance.component_library
+    library.schema_stack = rig_instance
+
+    try:
+        yield library
+
+    finally:
+        crosswalk.items.delete(rig_instance.host())
+
+
+# --------------------------------------------------------------------------------------
+def run(
+    recipes: typing.List[str],
+    manifest: str or None = None,
+    workers: int or None = None,
+) -> typing.List[typing.Dict]:
+    """
+    Lints the given recipes in parallel worker processes.
+
+    Args:
+        recipes: List of recipe filepaths to lint
+        manifest: Optional path to a component manifest to lint against. If not
+            given, the schemas are taken from the components available in the
+            current environment
+        workers: The number of worker processes. Defaults to the number of cpus
+
+    Returns:
+        A list of results, one for each recipe (see xstack.lint.Linter.lint_file)
+    """
+    if manifest:
+        schemas = xstack.lint.schemas_from_manifest(manifest)
+
+    else:
+        with component_library() as library:
+            schemas = xstack.lint.schemas_from_library(library)
+
+    return xstack.lint.lint_files(
+        recipes,
+        schemas,
+        workers=workers,
+        linter_class=RigLinter,
+    )
+
+
+# --------------------------------------------------------------------------------------
+def main(argv: typing.List[str] or None = None) -> int:
+    """
+    Command line entry point. Returns zero if no issues were found.
+    """
+    parser = argparse.ArgumentParser(
+        prog="aniseed.lint",
+        description="Checks rig recipes for problems without building them",
+    )
+    parser.add_argument("recipes", nargs="*", help="Recipe files to lint")
+    parser.add_argument("--manifest", default=None, help="Component manifest to lint against")
+    parser.add_argument("--write-manifest", default=None, help="Write the component manifest to this path")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--report", default=None, help="Filepath to write the json results to")
+
+    args = parser.parse_args(argv)
+
+    if args.write_manifest:
+        # -- Writing the manifest is typically done within mayapy, in which
+        # -- case maya must be initialised before the components can load
+        from . import environment
+        environment.initialise_headless()
+
+        with component_library() as library:
+            library.save_manifest(args.write_manifest)
+
+        if not args.recipes:
+            return 0
+
+    results = run(
+        args.recipes,
+        manifest=args.manifest or args.write_manifest,
+        workers=args.workers,
+    )
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=4)
+
+    return 0 if xstack.lint.report(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,451 @@
+"""
+This module holds the name formatter, which is the compiled form of the naming
+rule and segment styles of a rig configuration.
+
+Every node a component creates is named through the rig configuration, so rather
+than reading the rule and styling options and re-applying the styles for every
+name, the configuration compiles them once into a NameFormatter. The formatter
+is only re-compiled when one of the naming options changes.
+
+During a build, unique names are allocated through a NameRegistry, which keeps
+track of the names which are taken so that finding a free name does not require
+a query of the scene for every attempt.
+
+The reverse operation - breaking a name back down into the parts it was formed
+from - is carried out by a NameParser, which turns the rule into a regular
+expression.
+"""
+import re
+import string
+import typing
+import crosswalk
+
+
+# --------------------------------------------------------------------------------------
+def ignore(name: typing.Any) -> str:
+    """
+    callable that does nothing
+    """
+    return name
+
+
+# --------------------------------------------------------------------------------------
+def camel_to_snake(name: str) -> str:
+    """
+    Will convert a camel case string to a snake case string
+    """
+    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+
+
+# --------------------------------------------------------------------------------------
+def title(name: str) -> str:
+    """
+    Will convert a snake case string to a camel case string
+    """
+    if name[0].isupper() and "_" not in name:
+        return name
+
+    return name.title()
+
+
+# --------------------------------------------------------------------------------------
+def titled(name: str) -> str:
+    """
+    Will title each underscore separated part of the string and join them
+    """
+    return "".join(
+        [
+            title(part)
+            for part in name.split("_")
+            if part
+        ]
+    )
+
+
+# -- These are the styles which can be applied to each segment of a name
+STYLES = dict(
+    ignore=ignore,
+    lower=str.lower,
+    upper=str.upper,
+    titled=titled,
+    snake=camel_to_snake,
+)
+
+# -- These are the options of a rig configuration which the formatter is
+# -- compiled from. A change to any of them requires a re-compile
+NAMING_OPTIONS = [
+    "rule",
+    "classification_style",
+    "description_style",
+    "counter_style",
+    "location_style",
+    "counter_padding",
+]
+
+
+# --------------------------------------------------------------------------------------
+def apply_style(str_value: str, format_type: str) -> str:
+    """
+    Applies the given style to the string. Unknown styles leave the string
+    unchanged
+    """
+    return STYLES.get(format_type, ignore)(str_value)
+
+
+# --------------------------------------------------------------------------------------
+class NameFormatter:
+    """
+    The compiled form of a naming rule and its segment styles.
+
+    The styled form of each classification, description, location and counter
+    is memoised, as the same few values are used for the vast majority of names.
+    """
+
+    # ----------------------------------------------------------------------------------
+    def __init__(
+        self,
+        rule: str,
+        classification_style: str = "ignore",
+        description_style: str = "ignore",
+        location_style: str = "ignore",
+        counter_style: str = "ignore",
+        counter_padding: int = 2,
+    ):
+        self.rule = rule
+        self.classification_style = classification_style
+        self.description_style = description_style
+        self.location_style = location_style
+        self.counter_style = counter_style
+        self.counter_padding = counter_padding
+
+        self._format = rule.format
+
+        # -- The pattern matches any name this rule can form, by replacing
+        # -- each of the fields with a wildcard
+        self.pattern = re.sub(r"\{[^}]*\}", "*", rule)
+
+        self._classifications = _StyledCache(classification_style)
+        self._descriptions = _StyledCache(description_style)
+        self._locations = _StyledCache(location_style)
+        self._counters = _StyledCache(counter_style)
+
+    # ----------------------------------------------------------------------------------
+    @classmethod
+    def from_config(cls, config) -> "NameFormatter":
+        """
+        Compiles a formatter from the options of the given rig configuration
+        """
+        return cls(
+            rule=config.option("rule").get(),
+            classification_style=config.option("classification_style").get(),
+            description_style=config.option("description_style").get(),
+            location_style=config.option("location_style").get(),
+            counter_style=config.option("counter_style").get(),
+            counter_padding=config.option("counter_padding").get(),
+        )
+
+    # ----------------------------------------------------------------------------------
+    def format(self, classification: str, description: str, location: str, counter: int = 1) -> str:
+        """
+        Returns the name formed from the given parts
+        """
+        return self._format(
+            classification=self._classifications[classification],
+            description=self._descriptions[description],
+            location=self._locations[location],
+            counter=self._counters[str(counter).rjust(self.counter_padding, "0")],
+        )
+
+    # ----------------------------------------------------------------------------------
+    def raw_description(self, styled: str) -> str:
+        """
+        Returns the description which was styled to form the given string, or
+        the string itself if no description this formatter styled formed it
+        """
+        return self._descriptions.raw(styled)
+
+
+# --------------------------------------------------------------------------------------
+class NameRegistry:
+    """
+    Keeps track of which names are taken, allowing unique names to be allocated
+    without querying the scene for every attempt.
+
+    The registry is seeded on first use with a single query of all the names in
+    the scene which match the pattern of the naming rule. Where the application
+    does not support querying names in bulk, each name is checked individually
+    the first time it is encountered and the result is remembered.
+
+    Nodes may also be created outside of the registry after it was seeded, so a
+    name which was free when we seeded is confirmed to still be free before it
+    is allocated. This is a single query per allocation rather than per attempt.
+
+    Names allocated through the registry remain reserved for the lifetime of the
+    registry, even if the node they were given to is deleted.
+
+    Args:
+        pattern: Wildcard pattern matching the names to seed the registry with
+    """
+
+    # ----------------------------------------------------------------------------------
+    def __init__(self, pattern: str = "*"):
+        self.pattern = pattern
+
+        # -- Names which are known to be taken, either because they were
+        # -- allocated or because they were confirmed to exist in the scene
+        self._taken: typing.Set[str] = set()
+
+        # -- The names which existed when we were seeded. This is None if we
+        # -- have not been seeded or if seeding is not supported
+        self._scene_names: typing.Set[str] or None = None
+        self._seeded = False
+
+        # -- For each combination of parts, the range of counters which are
+        # -- known to be taken, allowing allocation to skip straight past them
+        self._counters: typing.Dict[typing.Tuple, typing.Tuple[int, int]] = dict()
+
+    # ----------------------------------------------------------------------------------
+    def seed(self):
+        """
+        Reads all the names matching our pattern from the scene in a single query
+        """
+        self._seeded = True
+
+        # -- Not every application implementation supports bulk queries
+        all_names = getattr(crosswalk.items, "all_names", None)
+
+        if all_names:
+            self._scene_names = set(all_names(self.pattern))
+
+    # ----------------------------------------------------------------------------------
+    def is_taken(self, name: str) -> bool:
+        """
+        Returns True if the name is already in use
+        """
+        if name in self._taken:
+            return True
+
+        if not self._seeded:
+            self.seed()
+
+        # -- Anything not present when we seeded, and which we have not
+        # -- allocated since, is free
+        if self._scene_names is not None and name not in self._scene_names:
+            return False
+
+        # -- The node may have been deleted since we seeded, so we confirm it
+        # -- still exists and remember the result
+        if crosswalk.items.exists(name):
+            self._taken.add(name)
+            return True
+
+        if self._scene_names is not None:
+            self._scene_names.discard(name)
+
+        return False
+
+    # ----------------------------------------------------------------------------------
+    def _created_since_seeding(self, name: str) -> bool:
+        """
+        Returns True if a node with the given name has been created outside of
+        the registry since we were seeded, remembering that it is taken
+        """
+        if self._scene_names is None or name in self._scene_names:
+            return False
+
+        if crosswalk.items.exists(name):
+            self._taken.add(name)
+            return True
+
+        return False
+
+    # ----------------------------------------------------------------------------------
+    def reserve(self, name: str):
+        """
+        Marks the given name as taken
+        """
+        self._taken.add(name)
+
+    # ----------------------------------------------------------------------------------
+    def allocate(
+        self,
+        formatter: NameFormatter,
+        classification: str,
+        description: str,
+        location: str,
+        counter: int = 1,
+    ) -> typing.Tuple[str, int]:
+        """
+        Returns the first free name (and the counter used to form it) from the
+        given counter upwards, reserving it.
+        """
+        key = (formatter.rule, classification, description, location)
+        start = counter
+
+        # -- If we already know the counters from here upwards are taken then
+        # -- we skip straight past them
+        low, high = self._counters.get(key, (start, start))
+
+        if low <= start < high:
+            counter = high
+
+        while True:
+            name = formatter.format(classification, description, location, counter)
+
+            if not self.is_taken(name) and not self._created_since_seeding(name):
+                break
+
+            counter += 1
+
+        self.reserve(name)
+
+        # -- Every counter from the start up to and including the one we just
+        # -- allocated is now taken
+        if low <= start <= high:
+            self._counters[key] = (min(low, start), counter + 1)
+
+        else:
+            self._counters[key] = (start, counter + 1)
+
+        return name, counter
+
+
+# --------------------------------------------------------------------------------------
+class NameParser:
+    """
+    Breaks names back down into the parts they were formed from, by turning the
+    naming rule into a regular expression.
+
+    Classifications and locations are matched against the known labels first,
+    which resolves any ambiguity where a description holds the separator, and
+    are returned as the unstyled label. Descriptions are returned as they were
+    given to the formatter where it formed them, and otherwise as they appear
+    in the name. Either forms the same name when passed back through the
+    formatter, as every style gives the same result when applied again.
+
+    Args:
+        formatter: The formatter whose names should be parsed
+        classifications: The known classification labels
+        locations: The known location labels
+    """
+
+    # -- The pattern each field matches when it is not one of the known labels
+    _FIELD_PATTERNS = dict(
+        classification=".+?",
+        description=".+?",
+        location=".+?",
+        counter="[0-9]+",
+    )
+
+    # ----------------------------------------------------------------------------------
+    def __init__(
+        self,
+        formatter: NameFormatter,
+        classifications: typing.List[str] or None = None,
+        locations: typing.List[str] or None = None,
+    ):
+        self._labels = dict(
+            classification={
+                apply_style(label, formatter.classification_style): label
+                for label in classifications or list()
+            },
+            location={
+                apply_style(label, formatter.location_style): label
+                for label in locations or list()
+            },
+        )
+
+        self._formatter = formatter
+        self._regex = re.compile(self._compile(formatter.rule))
+
+    # ----------------------------------------------------------------------------------
+    def _compile(self, rule: str) -> str:
+        pattern = ""
+        seen = set()
+
+        for literal, field_name, _, _ in string.Formatter().parse(rule):
+            pattern += re.escape(literal)
+
+            if field_name is None:
+                continue
+
+            # -- A field used more than once must hold the same value
+            if field_name in seen:
+                pattern += f"(?P={field_name})"
+                continue
+
+            seen.add(field_name)
+
+            # -- Longest labels first, so a label is never matched by a
+            # -- shorter label it begins with
+            alternatives = [
+                re.escape(label)
+                for label in sorted(self._labels.get(field_name, dict()), key=len, reverse=True)
+                if label
+            ]
+            alternatives.append(self._FIELD_PATTERNS.get(field_name, ".+?"))
+
+            pattern += f"(?P<{field_name}>{'|'.join(alternatives)})"
+
+        return f"^{pattern}$"
+
+    # ----------------------------------------------------------------------------------
+    def parse(self, name: str) -> typing.Dict or None:
+        """
+        Returns the classification, description, location and counter the name
+        was formed from, or None if the name does not follow the rule
+        """
+        match = self._regex.match(name)
+
+        if not match:
+            return None
+
+        parts = match.groupdict()
+
+        for field_name, labels in self._labels.items():
+            if field_name in parts:
+                parts[field_name] = labels.get(parts[field_name], parts[field_name])
+
+        if "description" in parts:
+            parts["description"] = self._formatter.raw_description(parts["description"])
+
+        if "counter" in parts:
+            parts["counter"] = int(parts["counter"])
+
+        return parts
+
+
+# --------------------------------------------------------------------------------------
+class _StyledCache(dict):
+    """
+    Memoises the styled form of each string it is given, along with the string
+    each styled form was first formed from
+    """
+
+    # -- Descriptions can be unbounded, so we cap the number we hold
+    _LIMIT = 4096
+
+    # ----------------------------------------------------------------------------------
+    def __init__(self, style: str):
+        super(_StyledCache, self).__init__()
+        self._apply = STYLES.get(style, ignore)
+        self._raw: typing.Dict[str, str] = dict()
+
+    # ----------------------------------------------------------------------------------
+    def __missing__(self, value: str) -> str:
+        styled = self._apply(value)
+
+        if len(self) < self._LIMIT:
+            self[value] = styled
+            self._raw.setdefault(styled, value)
+
+        return styled
+
+    # ----------------------------------------------------------------------------------
+    def raw(self, styled: str) -> str:
+        """
+        Returns the string the given styled form was formed from, or the styled
+        form itself if it is not known
+        """
+        return self._raw.get(styled, styled)
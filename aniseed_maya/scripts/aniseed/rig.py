@@ -1,10 +1,12 @@
 import os
 import re
 import json
+import hashlib
 import xstack
 import typing
 import crosswalk
-import traceback
+
+from xstack.constants import log
 
 from . import host as host_
 from . import config
@@ -12,6 +14,12 @@ from . import component
 from . import constants
 
 
+# -- Rigs constructed through Rig.from_host are cached, keyed by the scene and the
+# -- unique identifier of their host. Each is only reused whilst the recipe stored
+# -- on the host is the recipe the rig last stored
+_RIG_CACHE: typing.Dict[typing.Tuple[str, str], "Rig"] = dict()
+
+
 # --------------------------------------------------------------------------------------
 class Rig(xstack.Stack):
     """
@@ -60,6 +68,9 @@ class Rig(xstack.Stack):
         # -- Store our host
         self._host = host
 
+        # -- This is the revision of the recipe we last stored on the host
+        self._recipe_revision: str = ""
+
         # -- Add our rig configuration class to the component library. We do this because
         # -- we always need one rig configuration class to be present
         self.component_library.register(
@@ -128,13 +139,78 @@ class Rig(xstack.Stack):
         data and store it within the host object
         """
         data = super(Rig, self).serialise()
+        self._store_recipe(data)
+
+        return data
+
+    # ----------------------------------------------------------------------------------
+    def _store_recipe(self, data: typing.Dict):
+        """
+        Stores the serialised data on the host, along with its header
+        """
+        recipe = json.dumps(data)
 
         crosswalk.attributes.set_value(
             item=self.host(),
             attribute_name="recipe",
-            value=json.dumps(data),
+            value=recipe,
         )
-        return data
+
+        # -- The revision lets other rig instances (and the rig cache) know
+        # -- whether the recipe has changed since they read it
+        self._recipe_revision = _revision(recipe)
+
+        # -- Hosts created by earlier versions will not have a header
+        if not crosswalk.attributes.has_attribute(self.host(), constants.RECIPE_HEADER_ATTRIBUTE):
+            crosswalk.attributes.add_string_attribute(
+                item=self.host(),
+                attribute_name=constants.RECIPE_HEADER_ATTRIBUTE,
+                value="{}",
+            )
+
+        crosswalk.attributes.set_value(
+            item=self.host(),
+            attribute_name=constants.RECIPE_HEADER_ATTRIBUTE,
+            value=json.dumps(_header(data, self._recipe_revision)),
+        )
+
+    # ----------------------------------------------------------------------------------
+    def recipe_revision(self) -> str:
+        """
+        Returns the revision of the recipe this rig last stored on its host
+        """
+        return self._recipe_revision
+
+    # ----------------------------------------------------------------------------------
+    @classmethod
+    def from_host(cls, host, component_paths: typing.List or None = None) -> "Rig":
+        """
+        Returns the rig for the given host. Rigs are cached, so repeated calls
+        return the same live instance for as long as the recipe on the host
+        has not been changed by anything other than that instance.
+
+        A cached rig is validated against the revision held in the header of
+        the host rather than the recipe itself, as recipes can be very large.
+        The recipe must therefore only ever be written along with its header
+        (as Rig.serialise does), and writing it directly is not supported.
+
+        Note that the component paths are only used when a rig is constructed.
+        """
+        key = (crosswalk.scene.path(), crosswalk.items.get_uuid(host))
+        rig = _RIG_CACHE.get(key)
+
+        if (
+            isinstance(rig, cls)
+            and rig.recipe_revision()
+            and crosswalk.items.get(rig.host()) == crosswalk.items.get(host)
+            and rig.recipe_revision() == _read_header(host).get("revision")
+        ):
+            return rig
+
+        rig = cls(host=host, component_paths=component_paths)
+        _RIG_CACHE[key] = rig
+
+        return rig
 
     # ----------------------------------------------------------------------------------
     @classmethod
@@ -159,72 +235,141 @@ class Rig(xstack.Stack):
             value="{}"
         )
 
+        crosswalk.attributes.add_string_attribute(
+            item=host,
+            attribute_name=constants.RECIPE_HEADER_ATTRIBUTE,
+            value=json.dumps(_header(dict(), "")),
+        )
+
         return host
 
     # ----------------------------------------------------------------------------------
     # noinspection PyBroadException
-    def build(
+    def build_with_report(
         self,
         build_up_to: str = None,
         build_only: str = None,
         build_below: str = None,
-        validate_only: bool = False
-    ) -> bool:
+        validate_only: bool = False,
+        profile_memory: bool or None = None,
+        count_nodes: bool or None = None,
+    ) -> xstack.report.BuildReport:
         """
         We re-implement the build to allow us to check whether we have a rig configuration
         component in a stack. If we do not, or if it is not valid then we do not allow
         the build to continue
         """
+        rig_config = self.config()
+        error = None
+
+        # -- The checks are run within the build log, so that anything they
+        # -- log is captured against the configuration in the report
+        self.build_log.clear()
+
+        with self.build_log:
+            self.build_log.set_current(rig_config)
+
+            if not rig_config:
+                error = "No configuration component found. You must have one in order to build"
+
+            # -- We also need to check that it is valid. But not, its posisble this could be
+            # -- third party code, so we wrap it in a broad exception
+            else:
+                try:
+                    if not rig_config.is_valid():
+                        error = "Failed to validate the rig configuration. Stopping build."
+
+                except:
+                    log.exception(f"Failed to run validation for {rig_config.label()}")
+                    error = f"Failed to run validation for {rig_config.label()}"
+
+            if error:
+                log.error(error)
+
+        if error:
+            failed_report = xstack.report.BuildReport(label=self.label)
+            failed_report.error = error
+
+            if rig_config:
+                failed_report.add(rig_config)
+
+            failed_report.finalise(self)
+            self.build_completed.emit(failed_report)
+
+            return failed_report
+
+        return super(Rig, self).build_with_report(
+            build_up_to=build_up_to,
+            build_only=build_only,
+            build_below=build_below,
+            validate_only=validate_only,
+            profile_memory=profile_memory,
+            count_nodes=count_nodes,
+        )
+
+    # ----------------------------------------------------------------------------------
+    def node_count(self) -> int or None:
+        """
+        Returns the number of items in the scene, which allows the build report
+        to record how many nodes each component created
+        """
+        return crosswalk.items.count()
 
-        if not self.config():
-            print("No configuration component found. You must have one in order to build")
-            return False
-
-        # -- We also need to check that it is valid. But not, its posisble this could be
-        # -- third party code, so we wrap it in a broad exception
-        try:
-            if not self.config().is_valid():
-                print("Failed to validate the rig configuration. Stopping build.")
-                return False
-
-        except:
-            print(f"Failed to run validation for {self.config()}")
-            print(traceback.print_exc())
-            return False
-
-        result = super(Rig, self).build(
-            build_up_to,
-            build_only,
-            build_below,
-            validate_only,
+    # ----------------------------------------------------------------------------------
+    @classmethod
+    def list_hosts(cls) -> typing.List["RigHandle"]:
+        """
+        This will return a handle for every rig in the scene. Handles only read
+        the header of each rig, so this is cheap. Call open on a handle to get
+        the rig itself.
+        """
+        rig_hosts = crosswalk.items.all_items_with_attribute("aniseed_rig")
+
+        # -- The headers of all the rigs are read in a single call. Rigs saved
+        # -- before headers were introduced have no header, so are excluded.
+        # -- Host names are not unique, so the headers are matched to their
+        # -- hosts by position rather than by name
+        headered = [
+            crosswalk.attributes.has_attribute(rig_host, constants.RECIPE_HEADER_ATTRIBUTE)
+            for rig_host in rig_hosts
+        ]
+
+        headers = iter(
+            crosswalk.attributes.get_values(
+                [rig_host for rig_host, has_header in zip(rig_hosts, headered) if has_header],
+                constants.RECIPE_HEADER_ATTRIBUTE,
+            )
         )
 
-        return result
+        return [
+            RigHandle(
+                rig_host,
+                rig_class=cls,
+                header=next(headers) if has_header else None,
+            )
+            for rig_host, has_header in zip(rig_hosts, headered)
+        ]
 
     @classmethod
     def all_rigs(cls):
         """
-        This will attempt to find all instances of a rig in the scene
+        This will attempt to find all instances of a rig in the scene. Note that
+        this fully constructs every rig, so where possible use list_hosts instead.
         """
-        results = []
-        for rig_host in crosswalk.items.all_items_with_attribute("aniseed_rig"):
-            results.append(cls(host=rig_host))
-        return results
+        return [
+            handle.open()
+            for handle in cls.list_hosts()
+        ]
 
     def deserialize(self, data: typing.Dict):
         if isinstance(data, str):
-            with open(data, 'r') as f:
-                data = json.load(f)
+            data = xstack.compat.load(data)
 
         # -- Call the parent class which manages the load
         super(Rig, self).deserialize(data)
 
         # -- Store the data on the host node
-        crosswalk.attributes.set_value(
-            item=self.host(),
-            attribute_name="recipe",
-            value=json.dumps(data),
-        )
+        self._store_recipe(data)
 
         # -- Now call the host callback - which allows an embedded environment
         # -- to tie into the load process
@@ -255,6 +400,95 @@ class Rig(xstack.Stack):
         )
 
 
+# --------------------------------------------------------------------------------------
+class RigHandle:
+    """
+    A lightweight reference to a rig within the scene. This gives access to the
+    name, label and component count of the rig without constructing it. The rig
+    is only constructed when open is called.
+
+    Args:
+        host: The host object of the rig
+        rig_class: The class to construct the rig with when it is opened
+        header: The serialised header of the rig, if it has already been read.
+            If not given, it is read from the host
+    """
+
+    # ----------------------------------------------------------------------------------
+    def __init__(self, host, rig_class=Rig, header: str or None = None):
+        self.host = host
+        self.rig_class = rig_class
+
+        self.name: str = crosswalk.items.get_name(host)
+
+        header = json.loads(header) if header else _read_header(host)
+        self.label: str = header.get("label") or self.name
+        self.component_count: int = header.get("component_count", 0)
+
+    # ----------------------------------------------------------------------------------
+    def open(self, component_paths: typing.List or None = None) -> Rig:
+        """
+        Returns the rig, constructing it if it is not already cached
+        """
+        return self.rig_class.from_host(
+            self.host,
+            component_paths=component_paths,
+        )
+
+    # ----------------------------------------------------------------------------------
+    def __repr__(self):
+        return f"<RigHandle {self.name} ({self.component_count} components)>"
+
+
+# --------------------------------------------------------------------------------------
+def clear_rig_cache():
+    """
+    Removes all the rigs cached by Rig.from_host. Hosts should call this
+    whenever the scene is replaced.
+    """
+    _RIG_CACHE.clear()
+
+
+# --------------------------------------------------------------------------------------
+def _header(data: typing.Dict, revision: str) -> typing.Dict:
+    """
+    Returns the header describing the given serialised rig data
+    """
+    def _count(blocks):
+        return sum(1 + _count(block.get("children", list())) for block in blocks)
+
+    return dict(
+        label=data.get("label", ""),
+        component_count=_count(data.get("tree", list())),
+        revision=revision,
+    )
+
+
+# --------------------------------------------------------------------------------------
+def _read_header(host) -> typing.Dict:
+    """
+    Reads the header from the given host
+    """
+    if crosswalk.attributes.has_attribute(host, constants.RECIPE_HEADER_ATTRIBUTE):
+        header = crosswalk.attributes.get_value(host, constants.RECIPE_HEADER_ATTRIBUTE)
+
+        if header:
+            return json.loads(header)
+
+    # -- Rigs which have not been saved since headers were introduced
+    # -- have their header formed from the recipe
+    recipe = crosswalk.attributes.get_value(host, "recipe") or "{}"
+    return _header(json.loads(recipe), _revision(recipe))
+
+
+# --------------------------------------------------------------------------------------
+def _revision(recipe: str) -> str:
+    """
+    Returns a short hash of the serialised recipe
+    """
+    return hashlib.blake2b(recipe.encode("utf-8"), digest_size=8).hexdigest()
+
+
 def get_rig(node):
     """
     This is a convenient function for getting the Rig class for a
@@ -290,5 +524,4 @@ def get_rig(node):
         return _get_top_parent(parent_of_parent)
 
     root_node = _get_top_parent(node)
-    rig = Rig(host=root_node)
-    return rig
+    return Rig.from_host(root_node)
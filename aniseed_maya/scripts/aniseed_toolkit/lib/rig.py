@@ -31,7 +31,7 @@ def get(node):
     if not rig_node:
         return None
 
-    return aniseed.Rig(host=rig_node)
+    return aniseed.Rig.from_host(rig_node)
 
 
 def opposing_controls(controls: list[str] or None = None) -> list[str]:
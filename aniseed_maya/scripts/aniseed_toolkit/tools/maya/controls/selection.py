@@ -126,7 +126,7 @@ class GetSelectedRigs(aniseed_toolkit.Tool):
         selected_rigs = list(set(selected_rigs))
 
         return [
-            aniseed.Rig(host=rig)
+            aniseed.Rig.from_host(rig)
             for rig in selected_rigs
         ]
 